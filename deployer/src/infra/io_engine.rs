@@ -54,6 +54,7 @@ impl ComponentAction for IoEngine {
             .with_env("NVMF_TGT_CRDT", "0")
             .with_env("ENABLE_SNAPSHOT_REBUILD", "true")
             .with_bind("/tmp", "/host/tmp")
+            .with_bind("/dev/shm", "/host/dev/shm")
             .with_bind("/var/run/dpdk", "/var/run/dpdk");
 
             let core_list = match options.io_engine_isolate {
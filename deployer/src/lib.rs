@@ -141,8 +141,9 @@ pub struct StartOptions {
     pub image_pull_policy: composer::ImagePullPolicy,
 
     /// Use `N` io_engine instances.
-    /// Note: the io_engine containers have the host's /tmp directory mapped into the container
-    /// as /host/tmp. This is useful to create pool's from file images.
+    /// Note: the io_engine containers have the host's /tmp and /dev/shm directories mapped into
+    /// the container as /host/tmp and /host/dev/shm. This is useful to create pool's from file
+    /// images.
     #[clap(short, long, default_value = "1")]
     pub io_engines: u32,
 
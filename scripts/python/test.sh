@@ -10,6 +10,8 @@
 # To avoid cleanup/teardown of the cluster and resources you can use this:
 # Eg: CLEAN=0 scripts/python/test.sh tests/bdd/features/volume/create/test_feature.py
 # This way the cluster will remain in place, which sometimes can help figure out why it failed.
+# To reuse the cluster across runs, pass --reuse-cluster or set REUSE_CLUSTER, which skips the cluster cleanup:
+# Eg: REUSE_CLUSTER=1 scripts/python/test.sh tests/bdd/features/node/label/test_label_unlabel_node.py
 
 set -e
 
@@ -19,7 +21,9 @@ REPORT="$ROOT_DIR/report.xml"
 
 cleanup() {
   "$SCRIPT_DIR"/test-residue-cleanup.sh || true
-  "$SCRIPT_DIR"/../rust/deployer-cleanup.sh || true
+  if [ "$REUSE_CLUSTER" != "1" ]; then
+    "$SCRIPT_DIR"/../rust/deployer-cleanup.sh || true
+  fi
 }
 
 cleanup_handler() {
@@ -37,6 +41,16 @@ FAST=${FAST:-"0"}
 CLEAN=${CLEAN:-}
 # How to disable the above modes.
 DISABLE=("no", "n", "false", "f", "0")
+# Set to reuse an already running deployer cluster, leaving it running on exit
+case "${REUSE_CLUSTER,,}" in
+  yes|true|t|1) REUSE_CLUSTER="1" ;;
+  *) REUSE_CLUSTER="0" ;;
+esac
+for arg in "$@"; do
+  if [ "$arg" = "--reuse-cluster" ]; then
+    REUSE_CLUSTER="1"
+  fi
+done
 
 if ! [[ "${DISABLE[*]}" =~ "$FAST" ]]; then
   echo "FAST enabled - will not rebuild the csi&openapi clients nor the deployer. (Make sure they are built already)"
@@ -35,3 +35,30 @@ def env_cleanup():
     if clean is not None and clean.lower() in ("no", "false", "f", "0"):
         return False
     return True
+
+
+def env_reuse_cluster():
+    reuse = os.getenv("REUSE_CLUSTER")
+    if reuse is not None and reuse.lower() in ("yes", "true", "t", "1"):
+        return True
+    return False
+
+
+# The default io-engine image used by the deployer, as built by utils::io_engine_image() from the
+# registry and branch generated into test_constants.rs. Returns None if they can't be read.
+def io_engine_image():
+    path = f"{os.environ['ROOT_DIR']}/utils/utils-lib/src/test_constants.rs"
+    try:
+        with open(path) as file:
+            constants = dict(
+                re.findall(r'pub const (\w+): &str = "(.*)";', file.read())
+            )
+        registry = constants["TARGET_REGISTRY"]
+        tag = constants["TARGET_BRANCH"].replace("/", "-")
+    except (OSError, KeyError):
+        return None
+    return f"{registry}/{prod_name}-io-engine:{tag}"
+
+
+def env_fast_teardown():
+    return os.getenv("MAYASTOR_FAST_TEARDOWN") == "1"
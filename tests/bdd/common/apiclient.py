@@ -1,3 +1,4 @@
+import functools
 import json
 
 from openapi.api.volumes_api import VolumesApi
@@ -25,6 +26,8 @@ def get_cfg():
 
 
 # Return an API client
+# The client is shared by all the API objects, reusing the same connection pool.
+@functools.lru_cache(maxsize=1)
 def get_api_client():
     return api_client.ApiClient(get_cfg())
 
@@ -1,3 +1,4 @@
+import json
 import os
 import subprocess
 from datetime import datetime
@@ -9,6 +10,9 @@ import common
 from common.docker import Docker
 from common.nvme import nvme_disconnect_allours_wait
 
+# Records the arguments of the last started cluster, allowing it to be reused.
+STARTED_ARGS_FILE = "/tmp/bdd-deployer-args.json"
+
 
 @dataclass
 class StartOptions:
@@ -139,6 +143,7 @@ class Deployer(object):
         no_min_timeouts=False,
         rust_log: str = None,
         rust_log_silence: str = None,
+        reuse_cluster=False,
     ):
         options = StartOptions(
             io_engines,
@@ -167,15 +172,36 @@ class Deployer(object):
             rust_log_silence=rust_log_silence,
         )
         pytest.deployer_options = options
-        Deployer.start_with_opts(options)
+        Deployer.start_with_opts(options, reuse_cluster)
 
     # Start containers with the provided options.
+    # Only modules which cleanup their own resources after each scenario should set reuse_cluster,
+    # allowing the cluster to be reused across modules and test runs (see env_reuse_cluster).
     @staticmethod
-    def start_with_opts(options: StartOptions):
+    def start_with_opts(options: StartOptions, reuse_cluster=False):
         print(f"DeployerStart: {datetime.now()}")
+        pytest.deployer_reuse_cluster = reuse_cluster
         deployer_path = os.environ["ROOT_DIR"] + "/target/debug/deployer"
+        args = options.args()
+        if common.env_reuse_cluster() and Deployer.running():
+            if reuse_cluster and Deployer.started_args() == json.dumps(args):
+                print("DeployerStart: reusing the running cluster")
+                return
+            print("DeployerStart: replacing the running cluster")
+            subprocess.run([deployer_path, "stop"])
         # todo: get logs out to specific location
-        subprocess.run([deployer_path, "start"] + options.args(), check=True)
+        subprocess.run([deployer_path, "start"] + args, check=True)
+        with open(STARTED_ARGS_FILE, "w") as file:
+            file.write(json.dumps(args))
+
+    # Get the arguments the running cluster was started with, if known.
+    @staticmethod
+    def started_args():
+        try:
+            with open(STARTED_ARGS_FILE) as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
 
     # Stop containers
     @staticmethod
@@ -186,9 +212,40 @@ class Deployer(object):
             return
         if disconnect_nvme:
             nvme_disconnect_allours_wait()
+        if common.env_reuse_cluster() and getattr(
+            pytest, "deployer_reuse_cluster", False
+        ):
+            return
+        if os.path.exists(STARTED_ARGS_FILE):
+            os.remove(STARTED_ARGS_FILE)
+        if common.env_fast_teardown():
+            # the session is aborting, don't wait for the containers to stop gracefully
+            Deployer.kill()
+            return
         deployer_path = os.environ["ROOT_DIR"] + "/target/debug/deployer"
         subprocess.run([deployer_path, "stop"])
 
+    # Kill all the containers of the cluster, leaving their removal to the next start/cleanup.
+    @staticmethod
+    def kill():
+        containers = subprocess.run(
+            ["docker", "ps", "-q", "--filter", "label=io.composer.test.name"],
+            capture_output=True,
+            encoding="utf-8",
+        ).stdout.split()
+        if len(containers) > 0:
+            subprocess.run(["docker", "kill"] + containers, capture_output=True)
+
+    # Determines if the control plane of a previously started cluster is still running.
+    @staticmethod
+    def running():
+        try:
+            for component in ["core", "rest", "etcd"]:
+                Docker.check_container_running(component)
+        except Exception:
+            return False
+        return True
+
     @staticmethod
     def node_name(id: int):
         assert id >= 0
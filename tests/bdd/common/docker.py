@@ -1,4 +1,45 @@
 import docker
+import http.client
+import json
+import os
+import socket
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+# Label which the deployer applies to all of its containers.
+CLUSTER_LABEL = "io.composer.test.name"
+
+
+# HTTP connection over the docker daemon unix socket.
+class DockerSocketConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=10):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    # Get the path of the docker daemon socket, or None if it's not a unix socket (eg: tcp://).
+    @staticmethod
+    def default_socket_path():
+        host = os.getenv("DOCKER_HOST", "unix:///var/run/docker.sock")
+        if not host.startswith("unix://"):
+            return None
+        return host.removeprefix("unix://")
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+    # Issue a GET request to the docker api and return the decoded json response.
+    def get(self, path):
+        try:
+            self.request("GET", path)
+            response = self.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise Exception(f"GET {path} failed with {response.status}: {body}")
+            return json.loads(body)
+        finally:
+            self.close()
 
 
 class Docker(object):
@@ -15,6 +56,29 @@ class Docker(object):
             if container_state["Status"] != "running":
                 raise Exception("{} container not running", container_name)
 
+    # Get the state of all cluster containers with a single docker api call, keyed by container
+    # name. This queries the docker socket directly as it's considerably cheaper than the docker
+    # sdk, which is only used when the docker daemon isn't reachable through a unix socket.
+    @staticmethod
+    def containers_state():
+        socket_path = DockerSocketConnection.default_socket_path()
+        if socket_path is None:
+            docker_client = docker.from_env()
+            containers = docker_client.containers.list(
+                all=True, filters={"label": CLUSTER_LABEL}
+            )
+            return {container.name: container.status for container in containers}
+
+        filters = urllib.parse.quote(json.dumps({"label": [CLUSTER_LABEL]}))
+        containers = DockerSocketConnection(socket_path).get(
+            f"/containers/json?all=1&filters={filters}"
+        )
+        return {
+            name.lstrip("/"): container["State"]
+            for container in containers
+            for name in container["Names"]
+        }
+
     # Get the status of the container with the given name
     @staticmethod
     def container_status(container_name):
@@ -39,6 +103,18 @@ class Docker(object):
                 "IPAddress"
             ]
 
+    # Determines if the container with the given name has a mount at the given destination.
+    @staticmethod
+    def container_has_mount(container_name, destination):
+        docker_client = docker.from_env()
+        try:
+            container = docker_client.containers.get(container_name)
+        except docker.errors.NotFound as exc:
+            raise Exception("{} container not found", container_name)
+        else:
+            mounts = container.attrs["Mounts"]
+            return any(mount["Destination"] == destination for mount in mounts)
+
     # Kill a container with the given name.
     @staticmethod
     def kill_container(name):
@@ -68,7 +144,28 @@ class Docker(object):
         container.unpause()
 
     # Restart a container with the given name.
-    def restart_container(name):
+    # The container is killed if it doesn't stop within the timeout (in seconds).
+    @staticmethod
+    def restart_container(name, timeout=10):
         docker_client = docker.from_env()
         container = docker_client.containers.get(name)
-        container.restart()
+        container.restart(timeout=timeout)
+
+    # Pull the given images which are not present yet, in parallel.
+    # Failures are ignored, leaving it to the deployer to report them.
+    @staticmethod
+    def pull_missing_images(images):
+        def pull_image(image):
+            docker_client = docker.from_env()
+            try:
+                docker_client.images.get(image)
+            except docker.errors.ImageNotFound:
+                try:
+                    docker_client.images.pull(image)
+                except docker.errors.APIError as exc:
+                    print(f"Failed to pull {image}: {exc}")
+
+        if len(images) == 0:
+            return
+        with ThreadPoolExecutor(max_workers=len(images)) as executor:
+            list(executor.map(pull_image, images))
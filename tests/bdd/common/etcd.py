@@ -1,4 +1,5 @@
 import etcd3
+import json
 
 from common import prod_domain_name, prod_name
 
@@ -20,6 +21,14 @@ class Etcd(object):
         # Return the NexusInfo value only.
         return self.client.get(key)[0]
 
+    # Get the SwitchOverSpec of the given volume, or None if there's no switchover in progress.
+    def get_switchover(self, volume_id):
+        key = "{}/SwitchOver/{}".format(self.__ns_key(), volume_id)
+        value = self.client.get(key)[0]
+        if value is None:
+            return None
+        return json.loads(value)
+
     def del_switchover(self, volume_id):
         key = "{}/SwitchOver/{}".format(self.__ns_key(), volume_id)
         self.client.delete(key)
@@ -6,6 +6,8 @@ from retrying import retry
 import common
 from common.command import run_cmd_async_at
 
+import glob
+import os
 import subprocess
 import json
 
@@ -287,6 +289,43 @@ def nvme_list_subsystems(device):
     return list(filter(lambda s: len(s["Subsystems"]) == 1, subsystems))[0]
 
 
+def nvme_device_controllers_state(device):
+    """Retrieve the state of the NVMe controllers (ie: paths) of the given device from sysfs,
+    keyed by the controller name.
+    This is much cheaper than the nvme cli, but returns None if sysfs doesn't expose the device.
+    """
+    block = f"/sys/class/block/{os.path.basename(device)}"
+    if not os.path.exists(block):
+        return None
+    # with native multipath the namespace head is a child of the subsystem, otherwise it's a
+    # child of its only controller
+    parent = os.path.dirname(os.path.realpath(block))
+    states = glob.glob(f"{parent}/state") or glob.glob(f"{parent}/nvme*/state")
+    if len(states) == 0:
+        return None
+    controllers_state = {}
+    for state in states:
+        with open(state) as file:
+            controller = os.path.basename(os.path.dirname(state))
+            controllers_state[controller] = file.read().strip()
+    return controllers_state
+
+
+def nvme_delete_controller(name):
+    """Delete the given NVMe controller on this host right away.
+    Unlike a disconnect, this doesn't wait for a controller which is reconnecting.
+    A controller which is already gone (eg: removed by the kernel meanwhile) is ignored.
+    """
+    delete_controller = f"/sys/class/nvme/{name}/delete_controller"
+    if not os.path.exists(delete_controller):
+        return
+    command = f"echo 1 | sudo tee {delete_controller}"
+    print(command)
+    result = subprocess.run(command, shell=True, capture_output=True, encoding="utf-8")
+    if result.returncode != 0:
+        print(f"{datetime.now()} Failed to delete controller {name}: {result.stderr}")
+
+
 NS_PROPS = ["nguid", "eui64"]
 
 
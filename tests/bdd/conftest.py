@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import common
+from common.docker import Docker
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reuse-cluster",
+        action="store_true",
+        default=False,
+        help="Reuse an already running deployer cluster instead of starting and stopping one per module",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--reuse-cluster"):
+        os.environ["REUSE_CLUSTER"] = "1"
+
+
+# When pytest stops early (eg: --exitfirst) the failing test's teardown also tears down the module
+# and session fixtures, so flag it first, allowing the cluster to be killed rather than gracefully
+# stopped.
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    if item.session.shouldfail or item.session.shouldstop:
+        os.environ["MAYASTOR_FAST_TEARDOWN"] = "1"
+
+
+# When interrupted, the remaining fixtures are torn down while the session finishes instead.
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    if exitstatus == pytest.ExitCode.INTERRUPTED:
+        os.environ["MAYASTOR_FAST_TEARDOWN"] = "1"
+
+
+# Pull the missing images of the containers which the deployer doesn't run from the host binaries
+# in parallel, once for the whole session, rather than one by one when starting the containers.
+@pytest.fixture(scope="session", autouse=True)
+def pull_images():
+    images = ["jaegertracing/all-in-one:latest"]
+    if os.getenv("IO_ENGINE_BIN") is None:
+        image = os.getenv("IO_ENGINE_IMAGE") or common.io_engine_image()
+        if image is not None:
+            images.append(image)
+    Docker.pull_missing_images(images)
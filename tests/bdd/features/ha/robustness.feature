@@ -11,23 +11,18 @@ Feature: Switchover Robustness
     And the ha clustering republishes
     Then the path should be established
 
-  Scenario: path failure with no free nodes
+  Scenario Outline: path failure with no free nodes
     Given a 2 replica volume
     And a connected nvme initiator
     When we cordon the non-target node
     And we stop the volume target node
     When the ha clustering fails a few times
-    And we uncordon the non-target node
-    Then the path should be established
-
-  Scenario: temporary path failure with no other nodes
-    Given a 2 replica volume
-    And a connected nvme initiator
-    When we cordon the non-target node
-    And we stop the volume target node
-    When the ha clustering fails a few times
-    And we restart the volume target node
+    And we <recovery>
     Then the path should be established
+    Examples:
+      | recovery                       |
+      | uncordon the non-target node   |
+      | restart the volume target node |
 
   Scenario: second failure during switchover with no other nodes
     Given a 2 replica volume
@@ -1,7 +1,11 @@
 """Switchover Robustness feature tests."""
 
+import errno
+import functools
 import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from pytest_bdd import (
     given,
@@ -12,8 +16,6 @@ from pytest_bdd import (
 import pytest
 import subprocess
 
-from retrying import retry
-
 import common.nvme
 from common.deployer import Deployer
 from common.apiclient import ApiClient
@@ -21,6 +23,8 @@ from common.docker import Docker
 from common.etcd import Etcd
 from common.nvme import (
     nvme_connect,
+    nvme_delete_controller,
+    nvme_device_controllers_state,
     nvme_disconnect,
     nvme_list_subsystems,
     nvme_set_reconnect_delay,
@@ -34,7 +38,6 @@ from openapi.model.publish_volume_body import PublishVolumeBody
 from openapi.model.volume_policy import VolumePolicy
 from openapi.model.volume_share_protocol import VolumeShareProtocol
 
-VOLUME_UUID = "5cd5378e-3f05-47f1-a830-a0f5873a1449"
 VOLUME_SIZE = int(20 * 1024 * 1024)
 POOL_SIZE = 100 * 1024 * 1024
 TARGET_NODE_1 = "io-engine-1"
@@ -60,6 +63,7 @@ def init():
         io_engine_coreisol=True,
         io_engine_env="MAYASTOR_HB_INTERVAL_SEC=0",
         agents_env="DETECTION_PERIOD=100ms,SUBSYS_REFRESH_PERIOD=100ms",
+        reuse_cluster=True,
     )
     yield
     Deployer.stop(True)
@@ -67,22 +71,34 @@ def init():
 
 @pytest.fixture(autouse=True)
 def init_scenario(init, disks):
-    for disk_index in range(0, 2):
+    def create_pool(disk_index):
         node_index = disk_index + 1
         name = f"pool-{node_index}"
         node = f"io-engine-{node_index}"
         ApiClient.pools_api().put_node_pool(
             node, name, CreatePoolBody([disks[disk_index]])
         )
+
+    # The pools are on different nodes, so they can be created concurrently.
+    with ThreadPoolExecutor(max_workers=len(disks)) as executor:
+        list(executor.map(create_pool, range(0, len(disks))))
     yield
     if Cluster.fixture_cleanup():
         Docker.kill_container("agent-ha-cluster")
         Docker.kill_container("agent-ha-node")
         ETCD_CLIENT.del_all_switchover()
         common.nvme.nvme_disconnect_allours_wait()
-        Docker.restart_container("agent-ha-cluster")
-        Docker.restart_container("agent-ha-node")
-        Cluster.cleanup()
+        # The volumes and pools cleanup doesn't depend on the ha agents, so bring them
+        # back up while the cleanup is in progress.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            restarted = executor.submit(restart_ha_agents)
+            Cluster.cleanup()
+            restarted.result()
+
+
+def restart_ha_agents():
+    Docker.restart_container("agent-ha-cluster")
+    Docker.restart_container("agent-ha-node")
 
 
 @scenario("robustness.feature", "reconnecting the new target times out")
@@ -95,11 +111,6 @@ def test_path_failure_with_no_free_nodes():
     """path failure with no free nodes."""
 
 
-@scenario("robustness.feature", "temporary path failure with no other nodes")
-def test_temporary_path_failure_with_no_other_nodes():
-    """temporary path failure with no other nodes."""
-
-
 @scenario("robustness.feature", "second failure during switchover with no other nodes")
 def test_second_failure_during_switchover_with_no_other_nodes():
     """second failure during switchover with no other nodes."""
@@ -108,9 +119,7 @@ def test_second_failure_during_switchover_with_no_other_nodes():
 @given("a connected nvme initiator")
 def a_connected_nvme_initiator(connect_to_first_path):
     """a connected nvme initiator."""
-    volume = pytest.volume
-    device_uri = volume.state["target"]["device_uri"]
-    nvme_set_reconnect_delay(device_uri, 1)
+    nvme_set_reconnect_delay(pytest.device_uri, 1)
 
 
 @given("a deployer cluster")
@@ -122,39 +131,37 @@ def a_deployer_cluster(init):
 @given("a reconnect_delay set to 15s")
 def a_reconnect_delay_set_to_15s():
     """a reconnect_delay set to 15s."""
-    volume = pytest.volume
-    device_uri = volume.state["target"]["device_uri"]
-    nvme_set_reconnect_delay(device_uri, 7)
+    nvme_set_reconnect_delay(pytest.device_uri, 7)
 
 
 @given("a single replica volume")
-def a_single_replica_volume():
+def a_single_replica_volume(volume_uuid):
     """a single replica volume."""
     ApiClient.volumes_api().put_volume(
-        VOLUME_UUID, CreateVolumeBody(VolumePolicy(True), 1, VOLUME_SIZE, False)
+        volume_uuid, CreateVolumeBody(VolumePolicy(True), 1, VOLUME_SIZE, False)
     )
     volume = ApiClient.volumes_api().put_volume_target(
-        VOLUME_UUID,
+        volume_uuid,
         publish_volume_body=PublishVolumeBody(
             {}, VolumeShareProtocol("nvmf"), node=TARGET_NODE_1
         ),
     )
-    pytest.volume = volume
+    pytest.device_uri = volume.state["target"]["device_uri"]
 
 
 @given("a 2 replica volume")
-def a_2_replica_volume():
+def a_2_replica_volume(volume_uuid):
     """a 2 replica volume."""
     ApiClient.volumes_api().put_volume(
-        VOLUME_UUID, CreateVolumeBody(VolumePolicy(True), 2, VOLUME_SIZE, False)
+        volume_uuid, CreateVolumeBody(VolumePolicy(True), 2, VOLUME_SIZE, False)
     )
     volume = ApiClient.volumes_api().put_volume_target(
-        VOLUME_UUID,
+        volume_uuid,
         publish_volume_body=PublishVolumeBody(
             {}, VolumeShareProtocol("nvmf"), node=TARGET_NODE_1
         ),
     )
-    pytest.volume = volume
+    pytest.device_uri = volume.state["target"]["device_uri"]
 
 
 @when("we cordon the non-target node")
@@ -177,8 +184,16 @@ def the_ha_clustering_republishes():
 
 @when("we restart the volume target node")
 def we_restart_the_volume_target_node():
-    """we restart the volume target."""
-    Docker.restart_container(TARGET_NODE_1)
+    """we restart the volume target node."""
+    # The target must lose its state, so pausing isn't enough, but there's no need to
+    # wait for a graceful shutdown either: crash it and bring it back right away.
+    # The following steps wait for the path to be re-established, so they can proceed
+    # while the container is restarting.
+    executor = ThreadPoolExecutor(max_workers=1)
+    restarted = executor.submit(Docker.restart_container, TARGET_NODE_1, timeout=0)
+    yield
+    restarted.result()
+    executor.shutdown()
 
 
 @when("we stop the volume target node")
@@ -196,10 +211,9 @@ def we_uncordon_the_nontarget_node():
 
 
 @when("the ha clustering fails a few times")
-def the_ha_clustering_fails_a_few_times():
+def the_ha_clustering_fails_a_few_times(volume_uuid):
     """the ha clustering fails a few times."""
-    # we have no way of determining this? maybe through etcd?
-    time.sleep(1)
+    wait_ha_failures(volume_uuid, 3)
 
 
 @then("the path should be established")
@@ -208,12 +222,6 @@ def the_path_should_be_established(connect_to_first_path):
     wait_initiator_reconnect(connect_to_first_path)
 
 
-@when("we restart the volume target node")
-def we_restart_the_volume_target_node():
-    """we restart the volume target node."""
-    Docker.restart_container(TARGET_NODE_1)
-
-
 @when("the ha clustering fails as there is no other node")
 def the_ha_clustering_fails_as_there_is_no_other_node():
     """the ha clustering fails as there is no other node."""
@@ -239,12 +247,31 @@ def the_volume_target_node_has_iopath_fixed():
     remove_network_failure(TARGET_NODE_1, NVME_SVC_PORT)
 
 
+# Each scenario uses its own volume, so no state is carried over from a previous scenario.
 @pytest.fixture
-def tmp_files():
-    files = []
-    for index in range(0, 2):
-        files.append(f"/tmp/disk_{index}")
-    yield files
+def volume_uuid():
+    yield str(uuid.uuid4())
+
+
+@pytest.fixture
+def tmp_files(init):
+    # prefer the memory backed /dev/shm, keeping the disk files off the block layer, but only
+    # if the io-engines have it mapped, which is not the case with older deployer binaries,
+    # and if it has enough free space for all the disk files
+    files = 2
+    tmp_dir = "/tmp"
+    if (
+        os.path.isdir("/dev/shm")
+        and shm_free_space() >= files * POOL_SIZE
+        and Docker.container_has_mount(TARGET_NODE_1, "/host/dev/shm")
+    ):
+        tmp_dir = "/dev/shm"
+    yield list(map(lambda index: f"{tmp_dir}/disk_{index}", range(0, files)))
+
+
+def shm_free_space():
+    stat = os.statvfs("/dev/shm")
+    return stat.f_bavail * stat.f_frsize
 
 
 @pytest.fixture
@@ -252,26 +279,77 @@ def disks(tmp_files):
     for disk in tmp_files:
         if os.path.exists(disk):
             os.remove(disk)
-        with open(disk, "w") as file:
-            file.truncate(POOL_SIZE)
-    # /tmp is mapped into /host/tmp within the io-engine containers
+        preallocate_file(disk, POOL_SIZE)
+    # /tmp and /dev/shm are mapped into /host/tmp and /host/dev/shm within the io-engines
     yield list(map(lambda file: f"/host{file}", tmp_files))
     for disk in tmp_files:
         if os.path.exists(disk):
             os.remove(disk)
 
 
-@pytest.fixture
-def connect_to_first_path():
-    volume = pytest.volume
-    device_uri = volume.state["target"]["device_uri"]
-    yield nvme_connect(device_uri)
-    nvme_disconnect(device_uri)
+# Create a file with all of its blocks allocated upfront, rather than a sparse file which
+# allocates them on first write, ie: while the io-engine initializes the pool.
+def preallocate_file(path, size):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as error:
+        # not all filesystems support fallocate
+        if error.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+            raise
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
 
 
-@retry(wait_fixed=100, stop_max_attempt_number=200)
+@pytest.fixture
+def connect_to_first_path():
+    device_uri = pytest.device_uri
+    device = nvme_connect(device_uri)
+    yield device
+    # Disconnecting a controller which is trying to reconnect to a target which is gone blocks
+    # until it gives up, so delete these controllers directly.
+    states = nvme_device_controllers_state(device) or {}
+    for controller, state in states.items():
+        if state in ("connecting", "resetting"):
+            nvme_delete_controller(controller)
+    if len(states) == 0 or "live" in states.values():
+        nvme_disconnect(device_uri)
+
+
+def backoff_retry(timeout, interval=0.05, max_interval=1.0):
+    """Retry the decorated function until it succeeds or the timeout (in seconds) expires.
+    The retry interval starts short and grows exponentially, so conditions which are met
+    quickly don't have to wait out a full fixed interval."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            deadline = time.monotonic() + timeout
+            delay = interval
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    if time.monotonic() + delay > deadline:
+                        raise
+                time.sleep(delay)
+                delay = min(delay * 1.5, max_interval)
+
+        return wrapper
+
+    return decorator
+
+
+@backoff_retry(timeout=20)
 def wait_initiator_reconnect(connect_to_first_path):
     device = connect_to_first_path
+    states = nvme_device_controllers_state(device)
+    if states is not None:
+        assert len(states) == 1, "Must be exactly one I/O path to target nexus"
+        assert list(states.values())[0] == "live", "I/O path is not healthy"
+        return
+
     desc = nvme_list_subsystems(device)
     assert (
         len(desc["Subsystems"]) == 1
@@ -281,12 +359,21 @@ def wait_initiator_reconnect(connect_to_first_path):
     assert subsystem["Paths"][0]["State"] == "live", "I/O path is not healthy"
 
 
-@retry(wait_fixed=100, stop_max_attempt_number=20)
+@backoff_retry(timeout=2)
 def wait_node_cordon(node):
     node = ApiClient.nodes_api().get_node(node)
     assert "cordonedstate" in node.spec.cordondrainstate
 
 
+@backoff_retry(timeout=5, interval=0.1, max_interval=0.1)
+def wait_ha_failures(volume_uuid, min_count):
+    switchover = ETCD_CLIENT.get_switchover(volume_uuid)
+    assert switchover is not None, "No switchover request for the volume"
+    assert (
+        switchover["retry_count"] >= min_count
+    ), f"Switchover has only failed {switchover['retry_count']} times"
+
+
 def simulate_network_failure(node_name, port):
     node_ip = Docker.container_ip(node_name)
     command = RULE_APPEND.format(DEPLOYER_NETWORK_INTERFACE, node_ip, port)
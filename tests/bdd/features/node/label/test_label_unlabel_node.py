@@ -1,6 +1,5 @@
 """Label a node, this will be used while scheduling replica of volume considering the feature tests."""
 
-import docker
 import pytest
 import sys
 import http
@@ -15,11 +14,8 @@ from openapi.model.node import Node
 from openapi.exceptions import ApiException
 
 NUM_IO_ENGINES = 2
-LABEL1 = "KEY1=VALUE1"
-LABEL1_NEW = "KEY1=NEW_LABEL"
-LABEL1_MAP = "{'KEY1': 'VALUE1'}"
-LABEL2 = "KEY2=VALUE2"
-LABEL_1_NEW = "KEY1=NEW_LABEL"
+LABEL1 = ("KEY1", "VALUE1")
+LABEL1_NEW = ("KEY1", "NEW_LABEL")
 LABEL_KEY_TO_DELETE = "KEY1"
 LABEL_KEY_TO_DELETE_ABSENT = "ABSENT_KEY"
 NODE_ID_1 = "io-engine-1"
@@ -28,7 +24,7 @@ NODE_ID_1 = "io-engine-1"
 # Fixtures
 @pytest.fixture(scope="module")
 def init():
-    Deployer.start(NUM_IO_ENGINES)
+    Deployer.start(NUM_IO_ENGINES, reuse_cluster=True)
     yield
     Deployer.stop()
 
@@ -76,23 +72,17 @@ def test_unlabel_a_node_when_the_label_key_is_not_present():
 @given("a control plane, two Io-Engine instances, two pools")
 def a_control_plane_two_ioengine_instances_two_pools(init):
     """a control plane, two Io-Engine instances, two pools."""
-    docker_client = docker.from_env()
-
-    # The control plane comprises the core agents, rest server and etcd instance.
-    for component in ["core", "rest", "etcd"]:
-        Docker.check_container_running(component)
-
-    # Check all Io-Engine instances are running
-    try:
-        io_engines = docker_client.containers.list(
-            all=True, filters={"name": "io-engine"}
-        )
-
-    except docker.errors.NotFound:
+    containers = Docker.containers_state()
+    io_engines = [name for name in containers if "io-engine" in name]
+    if len(io_engines) == 0:
         raise Exception("No Io-Engine instances")
 
-    for io_engine in io_engines:
-        Docker.check_container_running(io_engine.attrs["Name"])
+    # The control plane comprises the core agents, rest server and etcd instance.
+    # Check it and all Io-Engine instances are running.
+    for component in ["core", "rest", "etcd"] + io_engines:
+        assert (
+            containers.get(component) == "running"
+        ), f"{component} container not running"
 
     # Check for a nodes
     nodes = ApiClient.nodes_api().get_nodes()
@@ -165,7 +155,8 @@ def the_given_node_should_be_labeled_with_the_given_label(
     attempt_add_label_one, context
 ):
     """the given node should be labeled with the given label."""
-    labelling_succeeds(attempt_add_label_one, context)
+    labels = labelling_succeeds(attempt_add_label_one, context)
+    assert labels.get(LABEL1[0]) == LABEL1[1]
 
 
 @then('the node label should fail with error "PRECONDITION_FAILED"')
@@ -180,7 +171,8 @@ def the_given_node_should_be_labeled_with_the_new_given_label(
     attempt_add_label_one_with_overwrite, context
 ):
     """the given node should be labeled with the new given label."""
-    labelling_succeeds(attempt_add_label_one_with_overwrite, context)
+    labels = labelling_succeeds(attempt_add_label_one_with_overwrite, context)
+    assert labels.get(LABEL1_NEW[0]) == LABEL1_NEW[1]
 
 
 @then("the given node should remove the label with the given key")
@@ -188,7 +180,8 @@ def the_given_node_should_remove_the_label_with_the_given_key(
     attempt_delete_label_of_node, context
 ):
     """the given node should remove the label with the given key."""
-    labelling_succeeds(attempt_delete_label_of_node, context)
+    labels = labelling_succeeds(attempt_delete_label_of_node, context)
+    assert LABEL_KEY_TO_DELETE not in labels
 
 
 @then("the unlabel operation for the node should fail with error PRECONDITION_FAILED")
@@ -224,7 +217,7 @@ def attempt_add_label_one_with_overwrite(context):
 
 def attempt_add_label(node_name, label, overwrite, context):
     try:
-        [key, value] = label.split("=")
+        [key, value] = label
         overwrite = "true" if overwrite else "false"
         node = ApiClient.nodes_api().put_node_label(
             node_name, key, value, overwrite=overwrite
@@ -251,8 +244,10 @@ def attempt_delete_label(node_name, label, context):
         return exception
 
 
+# Returns the labels of the labelled node, as stored by the control plane.
 def labelling_succeeds(result, context):
     # raise result for exception information
     assert isinstance(result, Node)
-    ApiClient.nodes_api().get_node(result.id)
+    node = ApiClient.nodes_api().get_node(result.id)
     context["node"] = result
+    return node.spec.labels if hasattr(node.spec, "labels") else {}
@@ -1,5 +1,6 @@
 """Volume Node Topology feature tests."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pytest_bdd import given, scenario, then, when, parsers
 
 import pytest
@@ -276,9 +277,7 @@ NODE_LABELS = [
 def init():
     Deployer.start(NUM_IO_ENGINES, io_engine_coreisol=True)
     # Create the nodes with labels.
-    for label, node_name in NODE_LABELS:
-        [key, value] = label.split("=")
-        ApiClient.nodes_api().put_node_label(node_name, key, value, overwrite="false")
+    label_nodes()
 
     # Create the pools.
     for config in POOL_CONFIGURATIONS:
@@ -353,13 +352,12 @@ def a_control_plane_five_ioengine_instances_fifteen_pools(init):
     # Check for a nodes
     nodes = ApiClient.nodes_api().get_nodes()
     assert len(nodes) == 5
-    node1 = ApiClient.nodes_api().get_node(NODE_1_NAME)
+    node1, node2, node3, node4 = get_nodes(
+        [NODE_1_NAME, NODE_2_NAME, NODE_3_NAME, NODE_4_NAME]
+    )
     assert node1["spec"]["labels"] == {"zone-us": "us-west-1"}
-    node2 = ApiClient.nodes_api().get_node(NODE_2_NAME)
     assert node2["spec"]["labels"] == {"zone-ap": "ap-south-1"}
-    node3 = ApiClient.nodes_api().get_node(NODE_3_NAME)
     assert node3["spec"]["labels"] == {"zone-eu": "eu-west-3"}
-    node4 = ApiClient.nodes_api().get_node(NODE_4_NAME)
     assert node4["spec"]["labels"] == {
         "zone-us": "us-west-1",
         "zone-ap": "ap-south-1",
@@ -648,3 +646,36 @@ def no_of_suitable_nodes_honouring_exclusion(volume_node_topology_exclusion_labe
             if key in node_labels:
                 qualified_nodes.add(node_labels[key])
     return len(qualified_nodes)
+
+
+# Applies the NODE_LABELS to the nodes.
+# Each node is labelled in parallel, while the labels of the same node are applied
+# sequentially to avoid concurrent updates of the same node spec.
+def label_nodes():
+    node_labels = {}
+    for label, node_name in NODE_LABELS:
+        node_labels.setdefault(node_name, []).append(label)
+
+    def put_node_labels(node_name, labels):
+        nodes_api = ApiClient.nodes_api()
+        for label in labels:
+            [key, value] = label.split("=")
+            nodes_api.put_node_label(node_name, key, value, overwrite="false")
+
+    with ThreadPoolExecutor(max_workers=len(node_labels)) as executor:
+        futures = [
+            executor.submit(put_node_labels, node_name, labels)
+            for node_name, labels in node_labels.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+
+# Gets the given nodes parallely, returning them in the same order.
+def get_nodes(node_names):
+    with ThreadPoolExecutor(max_workers=len(node_names)) as executor:
+        return list(
+            executor.map(
+                lambda node_name: ApiClient.nodes_api().get_node(node_name), node_names
+            )
+        )